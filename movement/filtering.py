@@ -7,7 +7,7 @@ import xarray as xr
 from scipy import signal
 
 from movement.utils.logging import log_to_attrs, logger
-from movement.utils.reports import report_nan_values
+from movement.utils.reports import null_mask, report_nan_values
 
 
 @log_to_attrs
@@ -53,10 +53,25 @@ def filter_by_confidence(
     values in their dataset and adjust the threshold accordingly.
 
     """
-    data_filtered = data.where(confidence >= threshold)
+    is_confident = confidence >= threshold
+    data_filtered = data.where(is_confident)
     if print_report:
-        print(report_nan_values(data, "input"))
-        print(report_nan_values(data_filtered, "output"))
+        # The output is NaN wherever the input is NaN or the confidence
+        # is below the threshold, so the input NaN mask can be reused
+        nan_mask = null_mask(data)
+        print(
+            report_nan_values(
+                data, "input", force=True, precomputed_mask=nan_mask
+            )
+        )
+        print(
+            report_nan_values(
+                data_filtered,
+                "output",
+                force=True,
+                precomputed_mask=nan_mask | ~is_confident,
+            )
+        )
     return data_filtered
 
 
@@ -117,8 +132,8 @@ def interpolate_over_time(
         **kwargs,
     )
     if print_report:
-        print(report_nan_values(data, "input"))
-        print(report_nan_values(data_interpolated, "output"))
+        print(report_nan_values(data, "input", force=True))
+        print(report_nan_values(data_interpolated, "output", force=True))
     return data_interpolated
 
 
@@ -200,8 +215,8 @@ def rolling_filter(
 
     # Optional: Print NaN report
     if print_report:
-        print(report_nan_values(data, "input"))
-        print(report_nan_values(data_rolled, "output"))
+        print(report_nan_values(data, "input", force=True))
+        print(report_nan_values(data_rolled, "output", force=True))
 
     return data_rolled
 
@@ -269,8 +284,8 @@ def savgol_filter(
         **kwargs,
     )
     if print_report:
-        print(report_nan_values(data, "input"))
-        print(report_nan_values(data_smoothed, "output"))
+        print(report_nan_values(data, "input", force=True))
+        print(report_nan_values(data_smoothed, "output", force=True))
     return data_smoothed
 
 
@@ -922,7 +922,7 @@ def _warn_about_nan_proportion(
             "The result may be unreliable for point tracks with many "
             "missing values. The following tracks have at least "
             f"{nan_warn_threshold * 100:.3} % NaN values:\n"
-            f"{report_nan_values(data_to_warn_about)}",
+            f"{report_nan_values(data_to_warn_about, force=True)}",
             UserWarning,
             stacklevel=2,
         )
@@ -84,6 +84,38 @@ class MovementLogger:
             self.logger.exception, message, *args, **kwargs
         )
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Return whether messages of the given level may be logged.
+
+        This is a best-effort counterpart to
+        :meth:`logging.Logger.isEnabledFor`, which has no public
+        equivalent in :mod:`loguru`. It only compares the level against
+        the lowest level of the logger's handlers. Handler filters and
+        modules disabled via :meth:`loguru._logger.Logger.disable` are not
+        taken into account, so ``True`` does not guarantee that a message
+        will be logged. ``False`` means that no handler accepts the level.
+
+        Parameters
+        ----------
+        level : str
+            The name of the log level, e.g. ``"INFO"``.
+
+        Returns
+        -------
+        bool
+            ``False`` if no handler accepts messages of the given level,
+            ``True`` otherwise.
+
+        """
+        # loguru does not expose the lowest handler level publicly, so
+        # read it from its core and assume enabled if that is unavailable
+        min_level = getattr(
+            getattr(self.logger, "_core", None), "min_level", None
+        )
+        if min_level is None:
+            return True
+        return self.logger.level(level).no >= min_level
+
     def __getattr__(self, name):
         """Redirect attribute access to the loguru logger."""
         return getattr(self.logger, name)
@@ -1,9 +1,19 @@
 """Utility functions for reporting missing data."""
 
+import math
+from collections.abc import Callable, Hashable
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
 import xarray as xr
 
 from movement.utils.logging import logger
 
+if TYPE_CHECKING:
+    from dask.delayed import Delayed
+
 
 def calculate_nan_stats(
     data: xr.DataArray,
@@ -38,24 +48,191 @@ def calculate_nan_stats(
         A string containing the report.
 
     """
-    selection_criteria = {}
+    # Select by position, resolving each label directly on its index
+    selected_data = data
     if individual is not None:
-        selection_criteria["individuals"] = individual
+        ind_idx = data.indexes["individuals"].get_loc(individual)
+        selected_data = selected_data.isel(individuals=ind_idx)
     if keypoint is not None:
-        selection_criteria["keypoints"] = keypoint
-    selected_data = (
-        data.sel(**selection_criteria) if selection_criteria else data
+        kp_idx = data.indexes["keypoints"].get_loc(keypoint)
+        selected_data = selected_data.isel(keypoints=kp_idx)
+    n_nans = (
+        0
+        if _cannot_hold_nan(selected_data)
+        else int(null_mask(selected_data).sum(["time"]).compute())
+    )
+    n_points = selected_data.sizes["time"]
+    return _format_nan_stats(
+        keypoint, n_nans, n_points, _percent_tenths(n_nans, n_points)
+    )
+
+
+def _cannot_hold_nan(data: xr.DataArray) -> bool:
+    """Return whether the dtype of the input data cannot represent NaN."""
+    return np.issubdtype(data.dtype, np.integer) or np.issubdtype(
+        data.dtype, np.bool_
     )
-    n_nans = selected_data.isnull().any(["space"]).sum(["time"]).item()
-    n_points = selected_data.time.size
-    percent_nans = round((n_nans / n_points) * 100, 1)
-    return f"\n\t\t{keypoint}: {n_nans}/{n_points} ({percent_nans}%)"
 
 
-def report_nan_values(da: xr.DataArray, label: str | None = None) -> str:
+def _fast_isnull(data: xr.DataArray) -> xr.DataArray:
+    """Return a boolean mask of the NaN values in the input data.
+
+    For dask-backed data, :func:`pandas.isnull` is mapped over the chunks,
+    which keeps the computation lazy and is considerably faster per chunk
+    than :meth:`xarray.DataArray.isnull`. Otherwise, the latter is used.
+    """
+    if data.chunks is None:
+        return data.isnull()
+    return data.copy(data=data.data.map_blocks(pd.isnull, dtype=np.bool_))
+
+
+def null_mask(data: xr.DataArray) -> xr.DataArray:
+    """Return a boolean mask of the points that are NaN in the input data.
+
+    A point is considered NaN if any of its ``space`` coordinates are NaN.
+    For NumPy-backed floating point data, the NaN check and the reduction
+    over ``space`` are fused, accumulating one ``space`` slice at a time,
+    so that the full-size NaN mask is never materialised. For dask-backed
+    data, the mask is computed lazily.
+
+    Parameters
+    ----------
+    data : xarray.DataArray
+        The input data. If it has no ``space`` dimension, each element
+        is treated as a point.
+
+    Returns
+    -------
+    xarray.DataArray
+        A boolean mask with the dimensions of the input data, except
+        ``space``, which is ``True`` where the point is NaN.
+
+    """
+    if "space" not in data.dims:
+        return _fast_isnull(data)
+    if data.chunks is not None or not np.issubdtype(data.dtype, np.floating):
+        return _fast_isnull(data).any("space")
+    # Each space slice is a view that NumPy traverses in memory order,
+    # so there is no need to first transpose space to the innermost axis
+    space_axis = data.get_axis_num("space")
+    slices = np.moveaxis(data.values, space_axis, 0)
+    mask = np.zeros(slices.shape[1:], dtype=bool)
+    slice_mask = np.empty_like(mask)
+    for space_slice in slices:
+        np.isnan(space_slice, out=slice_mask)
+        np.logical_or(mask, slice_mask, out=mask)
+    return data.isel(space=0, drop=True).copy(data=mask)
+
+
+# Minimum number of array elements for which NaN points are counted with
+# the compiled kernel. Below this, the one-off cost of importing numba and
+# compiling the kernel outweighs the gain over the NaN mask path.
+_KERNEL_MIN_SIZE = 10_000_000
+
+
+def _count_nan_points_kernel(values: np.ndarray) -> np.ndarray:
+    """Count the time points at which each point has a NaN coordinate.
+
+    ``values`` must be a C-contiguous array of shape (time, space, points),
+    which is read in memory order. For each time point, the points with a
+    NaN in any ``space`` coordinate are first flagged, so that each point
+    is counted at most once per time point. This function is compiled
+    with numba on first use, see :func:`_compiled_count_nan_points_kernel`.
+    """
+    n_time, n_space, n_points = values.shape
+    counts = np.zeros(n_points, dtype=np.int64)
+    is_nan = np.zeros(n_points, dtype=np.bool_)
+    for t in range(n_time):
+        is_nan[:] = False
+        for s in range(n_space):
+            for p in range(n_points):
+                if np.isnan(values[t, s, p]):
+                    is_nan[p] = True
+        for p in range(n_points):
+            counts[p] += is_nan[p]
+    return counts
+
+
+@cache
+def _compiled_count_nan_points_kernel() -> Callable[[np.ndarray], np.ndarray]:
+    """Return the numba-compiled NaN points counting kernel.
+
+    numba is imported here, rather than at module level, so that importing
+    ``movement`` does not load it.
+    """
+    from numba import njit
+
+    return njit(cache=True)(_count_nan_points_kernel)
+
+
+def _count_nan_points(data: xr.DataArray, dims: list[Hashable]) -> np.ndarray:
+    """Count the number of time points at which each point is NaN.
+
+    A point is considered NaN if any of its ``space`` coordinates are NaN.
+    The counts are returned as a NumPy array whose axes follow ``dims``,
+    which must list all dimensions of ``data`` other than ``time`` and
+    ``space``. Large NumPy-backed ``float32`` or ``float64`` data in
+    native byte order, whose memory layout has ``time`` and ``space`` as
+    the two outermost axes (the default layout in ``movement``), is
+    counted directly on the underlying array with a compiled kernel.
+    Otherwise, the counts are reduced from the NaN mask.
+    """
+    if (
+        data.chunks is None
+        and data.size >= _KERNEL_MIN_SIZE
+        and "space" in data.dims
+        and data.dtype in (np.float32, np.float64)
+        and data.dtype.isnative
+    ):
+        values = data.transpose("time", "space", ...).values
+        if values.flags.c_contiguous:
+            other_dims = [d for d in data.dims if d not in ("time", "space")]
+            counts = _compiled_count_nan_points_kernel()(
+                values.reshape(*values.shape[:2], math.prod(values.shape[2:]))
+            )
+            return counts.reshape(values.shape[2:]).transpose(
+                [other_dims.index(d) for d in dims]
+            )
+    # Compute once, so that dask-backed data is only evaluated once
+    nan_counts = null_mask(data).sum("time").compute()
+    return nan_counts.transpose(*dims).values
+
+
+def _percent_tenths(
+    n_nans: int | np.ndarray, n_points: int
+) -> int | np.ndarray:
+    """Return NaN percentages in tenths, rounded half up.
+
+    Integer arithmetic is used, so ``n_nans`` may be an integer or an
+    integer array.
+    """
+    if n_points == 0:
+        return n_nans * 0
+    return (n_nans * 1000 + n_points // 2) // n_points
+
+
+def _format_nan_stats(
+    keypoint: str | None, n_nans: int, n_points: int, tenths: int
+) -> str:
+    """Format the NaN stats of a single keypoint as a report line."""
+    return (
+        f"\n\t\t{keypoint}: {n_nans}/{n_points} "
+        f"({tenths // 10}.{tenths % 10}%)"
+    )
+
+
+def report_nan_values(
+    da: xr.DataArray,
+    label: str | None = None,
+    force: bool = False,
+    precomputed_mask: xr.DataArray | None = None,
+) -> str:
     """Report the number and percentage of keypoints that are NaN.
 
     Numbers are reported for each individual and keypoint in the data.
+    The report is written to the logger at the INFO level. If the logger
+    does not emit INFO messages, the report is only compiled if ``force``
+    is ``True``.
 
     Parameters
     ----------
@@ -66,28 +243,147 @@ def report_nan_values(da: xr.DataArray, label: str | None = None) -> str:
         Label to identify the data in the report. If not provided,
         the name of the DataArray is used as the label.
         Default is ``None``.
+    force : bool, optional
+        Whether to compile the report even if the logger does not emit
+        INFO messages. This should be ``True`` whenever the returned
+        report is used by the caller. Default is ``False``.
+    precomputed_mask : xarray.DataArray, optional
+        A boolean mask marking the NaN values in ``da``, if it is already
+        available, e.g. from a previous computation. If provided, it is
+        used instead of computing the mask from ``da``. If the mask has a
+        ``space`` dimension, a point is considered NaN if any of its
+        ``space`` coordinates are marked. Default is ``None``.
 
     Returns
     -------
     str
-        A string containing the report.
+        A string containing the report, or an empty string if the report
+        was not compiled.
 
     """
-    # Compile the report
-    label = label or da.name
-    nan_report = f"\nMissing points (marked as NaN) in {label}"
-    # Check if the data has individuals and keypoints dimensions
-    has_individuals_dim = "individuals" in da.dims
-    has_keypoints_dim = "keypoints" in da.dims
-    # Default values for individuals and keypoints
-    individuals = da.individuals.values if has_individuals_dim else [None]
-    keypoints = da.keypoints.values if has_keypoints_dim else [None]
-
-    for ind in individuals:
-        ind_name = ind if ind is not None else da.individuals.item()
-        nan_report += f"\n\tIndividual: {ind_name}"
-        for kp in keypoints:
-            nan_report += calculate_nan_stats(da, keypoint=kp, individual=ind)
+    if not force and not logger.is_enabled_for("INFO"):
+        return ""
+    individuals, keypoints = _individuals_and_keypoints(da)
+    # Count NaNs for all individuals and keypoints in a single reduction
+    if precomputed_mask is None and _cannot_hold_nan(da):
+        counts = np.zeros((len(individuals), len(keypoints)), dtype=int)
+    else:
+        counts_dims = [
+            dim for dim in ("individuals", "keypoints") if dim in da.dims
+        ]
+        if precomputed_mask is None:
+            nan_counts = _count_nan_points(da, counts_dims)
+        else:
+            points_mask = (
+                precomputed_mask.any("space")
+                if "space" in precomputed_mask.dims
+                else precomputed_mask
+            )
+            # Compute once, so that dask-backed data is only evaluated once
+            nan_counts = (
+                points_mask.sum("time")
+                .compute()
+                .transpose(*counts_dims)
+                .values
+            )
+        counts = nan_counts.reshape(len(individuals), len(keypoints))
+    nan_report = _compile_nan_report(
+        label or da.name, individuals, keypoints, counts, da.sizes["time"]
+    )
     # Write nan report to logger
     logger.info(nan_report)
     return nan_report
+
+
+def report_nan_values_lazy(
+    da: xr.DataArray, label: str | None = None
+) -> "Delayed":
+    """Report the number and percentage of keypoints that are NaN, lazily.
+
+    This is the lazy counterpart of :func:`report_nan_values`, for use
+    within larger ``dask`` computations. For dask-backed data, the NaN
+    counts are added to the task graph and nothing is computed until the
+    returned object is. Unlike :func:`report_nan_values`, the report is
+    not written to the logger. Requires ``dask`` to be installed.
+
+    Parameters
+    ----------
+    da : xarray.DataArray
+        The input data containing ``keypoints`` and ``individuals``
+        dimensions.
+    label : str, optional
+        Label to identify the data in the report. If not provided,
+        the name of the DataArray is used as the label.
+        Default is ``None``.
+
+    Returns
+    -------
+    dask.delayed.Delayed
+        A delayed object which computes to a string containing the report.
+
+    """
+    import dask
+
+    individuals, keypoints = _individuals_and_keypoints(da)
+    counts_dims = [
+        dim for dim in ("individuals", "keypoints") if dim in da.dims
+    ]
+    if _cannot_hold_nan(da):
+        counts = np.zeros((len(individuals), len(keypoints)), dtype=int)
+    elif da.chunks is None:
+        counts = _count_nan_points(da, counts_dims)
+    else:
+        nan_counts = null_mask(da).sum("time")
+        counts = nan_counts.transpose(*counts_dims).data
+    return dask.delayed(_compile_nan_report)(
+        label or da.name,
+        individuals,
+        keypoints,
+        counts.reshape(len(individuals), len(keypoints)),
+        da.sizes["time"],
+    )
+
+
+def _individuals_and_keypoints(da: xr.DataArray) -> tuple[list, list]:
+    """Return the individuals and keypoints to report on.
+
+    If the data has no ``individuals`` dimension, the name of the single
+    individual is taken from the scalar coordinate. If it has no
+    ``keypoints`` dimension, a single unnamed keypoint is assumed.
+    """
+    individuals = (
+        da.individuals.values.tolist()
+        if "individuals" in da.dims
+        else [da.individuals.item()]
+    )
+    keypoints = (
+        da.keypoints.values.tolist() if "keypoints" in da.dims else [None]
+    )
+    return individuals, keypoints
+
+
+def _compile_nan_report(
+    label: str | None,
+    individuals: list,
+    keypoints: list,
+    counts: np.ndarray,
+    n_points: int,
+) -> str:
+    """Compile the NaN report from the (individuals, keypoints) counts."""
+    report_lines = [f"\nMissing points (marked as NaN) in {label}"]
+    # Convert to nested lists of Python ints once, for fast formatting
+    counts_per_ind = counts.tolist()
+    tenths_per_ind = _percent_tenths(counts, n_points).tolist()
+    for ind, ind_counts, ind_tenths in zip(
+        individuals, counts_per_ind, tenths_per_ind, strict=True
+    ):
+        report_lines.append(f"\n\tIndividual: {ind}")
+        report_lines.append(
+            "".join(
+                _format_nan_stats(kp, n_nans, n_points, tenths)
+                for kp, n_nans, tenths in zip(
+                    keypoints, ind_counts, ind_tenths, strict=True
+                )
+            )
+        )
+    return "".join(report_lines)
@@ -10,6 +10,7 @@ from movement.filtering import (
     rolling_filter,
     savgol_filter,
 )
+from movement.utils.reports import report_nan_values
 
 # Dataset fixtures
 list_valid_datasets_without_nans = [
@@ -41,7 +42,7 @@ class TestFilteringValidDataset:
         ],
     )
     def test_filter_with_nans_on_position(
-        self, filter_func, filter_kwargs, valid_dataset, helpers, request
+        self, filter_func, filter_kwargs, valid_dataset, request
     ):
         """Test NaN behaviour of the rolling and SG filters.
         Both filters should set all values to NaN if one element of the
@@ -60,10 +61,14 @@ class TestFilteringValidDataset:
             valid_input_dataset.position, **filter_kwargs, print_report=True
         )
         # Compute n nans in position after filtering per individual
-        n_nans_after_filtering_per_indiv = [
-            helpers.count_nans(position_filtered.isel(individuals=i))
-            for i in range(valid_input_dataset.sizes["individuals"])
+        non_individual_dims = [
+            dim for dim in position_filtered.dims if dim != "individuals"
         ]
+        n_nans_after_filtering_per_indiv = (
+            position_filtered.isnull()
+            .sum(dim=non_individual_dims)
+            .values.tolist()
+        )
         # Check number of nans per indiv is as expected
         assert (
             n_nans_after_filtering_per_indiv
@@ -143,9 +148,8 @@ class TestFilteringValidDatasetWithNaNs:
         )
         # Get position array with time unit in frames & seconds
         # assuming 10 fps = 0.1 s per frame
-        valid_dataset_in_seconds = valid_dataset_in_frames.copy()
-        valid_dataset_in_seconds.coords["time"] = (
-            valid_dataset_in_seconds.coords["time"] * 0.1
+        valid_dataset_in_seconds = valid_dataset_in_frames.assign_coords(
+            time=valid_dataset_in_frames.coords["time"] * 0.1
         )
         position = {
             "frames": valid_dataset_in_frames.position,
@@ -245,6 +249,61 @@ def test_filter_by_confidence_on_position(
     assert n_nans == valid_input_dataset.sizes["space"] * n_low_confidence_kpts
 
 
+@pytest.mark.parametrize("valid_dataset", list_all_valid_datasets)
+def test_filter_by_confidence_report(valid_dataset, capsys, request):
+    """Test that the NaN report printed when filtering by confidence,
+    which reuses the input NaN mask, matches the reports computed
+    directly from the input and output data.
+    """
+    valid_input_dataset = request.getfixturevalue(valid_dataset)
+    position_filtered = filter_by_confidence(
+        valid_input_dataset.position,
+        confidence=valid_input_dataset.confidence,
+        print_report=True,
+    )
+    expected_reports = [
+        report_nan_values(valid_input_dataset.position, "input", force=True),
+        report_nan_values(position_filtered, "output", force=True),
+    ]
+    assert capsys.readouterr().out == "\n".join(expected_reports) + "\n"
+
+
+@pytest.mark.parametrize(
+    "filter_func, filter_kwargs",
+    [
+        (filter_by_confidence, {"threshold": 0.6}),
+        (interpolate_over_time, {"method": "linear"}),
+        (rolling_filter, {"window": 3}),
+        (savgol_filter, {"window": 3}),
+    ],
+)
+@pytest.mark.parametrize("print_report", [True, False])
+def test_filter_report_only_if_requested(
+    valid_poses_dataset_with_nan,
+    filter_func,
+    filter_kwargs,
+    print_report,
+    mocker,
+):
+    """Test that the NaN report is only compiled when ``print_report``
+    is ``True``, for the input and the output data.
+    """
+    mock_report = mocker.patch(
+        "movement.filtering.report_nan_values", return_value=""
+    )
+    if filter_func is filter_by_confidence:
+        filter_kwargs = {
+            **filter_kwargs,
+            "confidence": valid_poses_dataset_with_nan.confidence,
+        }
+    filter_func(
+        valid_poses_dataset_with_nan.position,
+        **filter_kwargs,
+        print_report=print_report,
+    )
+    assert mock_report.call_count == (2 if print_report else 0)
+
+
 def test_median_filter_deprecation(valid_poses_dataset):
     """Test that calling median_filter raises a DeprecationWarning.
 
@@ -1,4 +1,6 @@
+import sys
 import warnings
+from pathlib import Path
 
 import pytest
 import xarray as xr
@@ -10,6 +12,7 @@ from movement.utils.logging import (
     logger,
     showwarning,
 )
+from movement.utils.reports import report_nan_values
 
 log_methods = ["debug", "info", "warning", "error", "exception"]
 
@@ -58,6 +61,34 @@ def test_showwarning():
     assert_log_entry_in_file(expected_components, pytest.LOG_FILE)
 
 
+@pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR"])
+def test_is_enabled_for(level):
+    """Ensure levels accepted by the test log file handler, which logs
+    at the DEBUG level, are reported as enabled.
+    """
+    assert logger.is_enabled_for(level)
+
+
+def test_is_enabled_for_level_below_handlers(valid_poses_dataset):
+    """Ensure a level below that of all handlers is reported as disabled,
+    and that the NaN report is then not compiled.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    try:
+        assert logger.is_enabled_for("INFO") is False
+        assert logger.is_enabled_for("WARNING") is True
+        assert report_nan_values(valid_poses_dataset.position) == ""
+    finally:
+        # Restore the logging to file set up for the test session
+        log_file = Path(pytest.LOG_FILE)
+        logger.configure(
+            log_file_name=log_file.stem,
+            log_directory=log_file.parent,
+            console=False,
+        )
+
+
 def test_logger_repr():
     """Ensure the custom logger's representation equals the loguru logger."""
     assert repr(MovementLogger()) == repr(loguru_logger)
@@ -1,6 +1,14 @@
+import numpy as np
 import pytest
+import xarray as xr
 
-from movement.utils.reports import report_nan_values
+from movement.utils.logging import logger
+from movement.utils.reports import (
+    calculate_nan_stats,
+    null_mask,
+    report_nan_values,
+    report_nan_values_lazy,
+)
 
 
 @pytest.mark.parametrize(
@@ -108,3 +116,153 @@ def test_report_nan_values_in_position_selecting_keypoint(
     assert all(ind in report_str for ind in expected_individuals) and all(
         ind not in report_str for ind in not_expected_individuals
     ), "Report contains incorrect individuals."
+
+
+def test_report_nan_values_counts(valid_poses_dataset_with_nan):
+    """Test that the report contains the correct number and percentage
+    of NaN points for each individual and keypoint.
+    """
+    report_str = report_nan_values(valid_poses_dataset_with_nan.position)
+    expected_lines = [
+        "\tIndividual: id_0",
+        "\t\tcentroid: 3/10 (30.0%)",
+        "\t\tleft: 1/10 (10.0%)",
+        "\t\tright: 10/10 (100.0%)",
+        "\tIndividual: id_1",
+        "\t\tcentroid: 0/10 (0.0%)",
+        "\t\tleft: 0/10 (0.0%)",
+        "\t\tright: 0/10 (0.0%)",
+    ]
+    assert report_str.split("\n")[2:] == expected_lines
+
+
+@pytest.mark.parametrize(
+    "force, expect_report",
+    [(False, False), (True, True)],
+)
+def test_report_nan_values_info_disabled(
+    valid_poses_dataset_with_nan, force, expect_report, mocker
+):
+    """Test that the report is only compiled when INFO messages are
+    disabled if ``force`` is set to ``True``.
+    """
+    mocker.patch.object(logger, "is_enabled_for", return_value=False)
+    report_str = report_nan_values(
+        valid_poses_dataset_with_nan.position, force=force
+    )
+    assert bool(report_str) == expect_report
+
+
+def test_report_nan_values_integer_data(valid_poses_dataset):
+    """Test that integer data, which cannot hold NaNs, is reported
+    as having no missing points.
+    """
+    report_str = report_nan_values(valid_poses_dataset.position.astype(int))
+    assert report_str.count("0/10 (0.0%)") == 6
+
+
+@pytest.mark.parametrize("chunked", [True, False])
+def test_report_nan_values_lazy(valid_poses_dataset_with_nan, chunked):
+    """Test that the lazy report is a delayed object which computes to
+    the same report as the eager one, for dask- and NumPy-backed data.
+    """
+    pytest.importorskip("dask")
+    from dask.delayed import Delayed
+
+    position = valid_poses_dataset_with_nan.position
+    input_data = position.chunk({"time": 5}) if chunked else position
+    lazy_report = report_nan_values_lazy(input_data)
+    assert isinstance(lazy_report, Delayed)
+    assert lazy_report.compute() == report_nan_values(position, force=True)
+
+
+def _transpose_in_memory(da):
+    """Return the data with time and space as the innermost axes,
+    both in its dimension order and in its memory layout.
+    """
+    transposed = da.transpose("individuals", "keypoints", "time", "space")
+    return transposed.copy(data=np.ascontiguousarray(transposed.values))
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+@pytest.mark.parametrize(
+    "convert",
+    [
+        lambda da: da.astype(np.float16),
+        lambda da: da.astype(np.float32),
+        lambda da: da.astype(np.float64),
+        lambda da: da.astype(">f8"),  # big-endian
+        _transpose_in_memory,
+    ],
+    ids=["float16", "float32", "float64", "big-endian", "transposed"],
+)
+def test_report_nan_values_dtypes_and_layouts(
+    valid_poses_dataset_with_nan, convert, use_kernel, mocker
+):
+    """Test that the report is the same across floating point dtypes
+    and memory layouts, and that it matches the NaN mask path when the
+    compiled kernel is enabled for the supported inputs.
+    """
+    position = valid_poses_dataset_with_nan.position
+    expected_report = report_nan_values(position, force=True)
+    if use_kernel:
+        mocker.patch("movement.utils.reports._KERNEL_MIN_SIZE", 0)
+    assert report_nan_values(convert(position), force=True) == expected_report
+
+
+@pytest.mark.parametrize(
+    "data_selection, chunked",
+    [
+        (lambda ds: ds.position, False),  # with space
+        (lambda ds: ds.position.sel(space="x"), False),  # without space
+        (lambda ds: ds.position, True),  # dask-backed
+    ],
+    ids=["numpy", "no_space", "dask"],
+)
+def test_null_mask(valid_poses_dataset_with_nan, data_selection, chunked):
+    """Test that the NaN mask marks points with any NaN ``space``
+    coordinate, regardless of how the data is stored.
+    """
+    data = data_selection(valid_poses_dataset_with_nan)
+    if chunked:
+        pytest.importorskip("dask")
+        data = data.chunk({"time": 5})
+    expected_mask = data.isnull()
+    if "space" in data.dims:
+        expected_mask = expected_mask.any("space")
+    mask = null_mask(data)
+    assert mask.dtype == bool
+    xr.testing.assert_equal(mask.compute(), expected_mask.compute())
+
+
+@pytest.mark.parametrize(
+    "data_type, individual, keypoint, expected_stats",
+    [
+        ("numpy", "id_0", "centroid", "3/10 (30.0%)"),
+        ("numpy", "id_0", "right", "10/10 (100.0%)"),
+        ("numpy", "id_1", "left", "0/10 (0.0%)"),
+        ("dask", "id_0", "left", "1/10 (10.0%)"),
+        ("dask", "id_1", "centroid", "0/10 (0.0%)"),
+        ("integer", "id_0", "centroid", "0/10 (0.0%)"),
+    ],
+)
+def test_calculate_nan_stats(
+    valid_poses_dataset_with_nan,
+    data_type,
+    individual,
+    keypoint,
+    expected_stats,
+):
+    """Test that the NaN stats of a keypoint and individual selected by
+    label are correct for NumPy-backed, dask-backed and integer data.
+    """
+    position = valid_poses_dataset_with_nan.position
+    if data_type == "dask":
+        pytest.importorskip("dask")
+        position = position.chunk({"time": 5})
+    elif data_type == "integer":
+        position = position.fillna(0).astype(int)
+    stats = calculate_nan_stats(
+        position, keypoint=keypoint, individual=individual
+    )
+    assert stats == f"\n\t\t{keypoint}: {expected_stats}"